@@ -1,23 +1,90 @@
 """
 Pytest configuration and fixtures for infrastructure property tests.
+
+The suite is distributed with pytest-xdist using group scheduling:
+
+    pytest -n auto --dist=loadgroup infrastructure/tests
+
+Tests that share session-parsed files are marked with ``xdist_group`` so each
+group runs on one worker and parses its files once; unmarked tests spread
+across the remaining workers.
 """
 import os
 import pytest
-import hcl2
+from hypothesis import HealthCheck, settings
 from pathlib import Path
 
+from pbt_metadata import get_property_meta
+
+
+# Hypothesis profiles, selected with the HYPOTHESIS_PROFILE environment variable
+# (defaulting to "ci" when CI is set and "dev" otherwise)
+settings.register_profile(
+    "dev", max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow]
+)
+# CI runs are ephemeral and should be reproducible, so they derandomize and
+# skip the example database instead of reading and writing .hypothesis/examples
+settings.register_profile(
+    "ci",
+    max_examples=50,
+    deadline=None,
+    database=None,
+    derandomize=True,
+    print_blob=False,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile(
+    "nightly", max_examples=200, deadline=None, suppress_health_check=[HealthCheck.too_slow]
+)
+settings.load_profile(
+    os.environ.get("HYPOTHESIS_PROFILE", "ci" if os.environ.get("CI") else "dev")
+)
+
+# Derived from the active profile for trivial pure-logic properties, which gain
+# nothing from the example database, random seeding or health checks
+settings.register_profile(
+    "fast",
+    database=None,
+    derandomize=True,
+    print_blob=False,
+    suppress_health_check=list(HealthCheck),
+)
+
+
+def pytest_configure(config):
+    """Register markers separating static file checks from property-based sweeps."""
+    config.addinivalue_line("markers", "static: fast checks over parsed Terraform files")
+    config.addinivalue_line("markers", "pbt: Hypothesis property-based tests")
+
+
+def pytest_collection_modifyitems(items):
+    """Report property-test metadata as JUnit properties for traceability."""
+    for item in items:
+        meta = get_property_meta(getattr(item, "cls", None), getattr(item, "function", None))
+        for key, value in meta.items():
+            if isinstance(value, (list, tuple)):
+                value = ", ".join(str(v) for v in value)
+            item.user_properties.append((key, value))
+
 
 def get_infrastructure_root():
     """Get the infrastructure root directory."""
     return Path(__file__).parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def infrastructure_root():
     """Fixture providing the infrastructure root path."""
     return get_infrastructure_root()
 
 
+@pytest.fixture(scope="session")
+def hcl_cache_dir(pytestconfig):
+    """Directory for cached Terraform parses in the pytest cache, or None if the cache is disabled."""
+    cache = getattr(pytestconfig, 'cache', None)
+    return cache.mkdir("hcl") if cache is not None else None
+
+
 @pytest.fixture
 def test_tfvars(infrastructure_root):
     """Load test environment terraform.tfvars."""
@@ -40,7 +107,8 @@ def load_tfvars(path: Path) -> dict:
     with open(path, 'r') as f:
         content = f.read()
     
-    # Parse HCL2 format
+    # Parse HCL2 format; hcl2 pulls in Lark, so only import it when tfvars are used
+    import hcl2
     try:
         parsed = hcl2.loads(content)
         # hcl2 returns lists for values, flatten single-item lists
@@ -0,0 +1,74 @@
+"""
+Disk cache for parsed Terraform files shared by the infrastructure property tests.
+
+Parses are pickled into a pytest cache directory keyed on the python-hcl2
+version and the file content, so editing a file or upgrading the parser both
+miss. The directory keeps only the most recently used parses.
+"""
+import hashlib
+import importlib.metadata
+import os
+import pickle
+from pathlib import Path
+
+# hcl2 rather than a native parser such as pygohcl, which merges repeated blocks
+# (e.g. several ``statement`` blocks) into one mapping the tests cannot consume
+import hcl2
+
+
+# Upper bound on pickled parses kept in the cache directory; least recently used go first
+HCL_CACHE_MAX_FILES = 64
+
+# Mixed into every cache key so upgrading the parser invalidates old pickles
+HCL_PARSER_VERSION = f"python-hcl2 {importlib.metadata.version('python-hcl2')}".encode()
+
+
+def _evict_stale_cache_files(cache_dir: Path) -> None:
+    """Drop the least recently used pickled parses beyond HCL_CACHE_MAX_FILES."""
+    entries = sorted(cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[HCL_CACHE_MAX_FILES:]:
+        stale.unlink(missing_ok=True)
+
+
+def _read_cache_file(cache_file: Path):
+    """Return the pickled parse in cache_file, or None on any cache miss or I/O error."""
+    try:
+        with open(cache_file, 'rb') as f:
+            parsed = pickle.load(f)
+        os.utime(cache_file)
+        return parsed
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def _write_cache_file(cache_dir: Path, cache_file: Path, parsed: dict) -> None:
+    """Pickle a parse into the cache, ignoring I/O errors so they never fail a test."""
+    # Write then rename so concurrent xdist workers never read a partial file
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        _evict_stale_cache_files(cache_dir)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def load_parsed_hcl(path: Path, cache_dir: Path = None) -> dict:
+    """
+    Read and parse a Terraform file with hcl2, going through the disk cache if given.
+
+    Only reading the Terraform file and parsing it can raise; cache misses and
+    cache I/O errors fall back to parsing.
+    """
+    raw = path.read_bytes()
+    if cache_dir is None:
+        return hcl2.loads(raw.decode())
+
+    digest = hashlib.blake2b(raw, digest_size=16, key=HCL_PARSER_VERSION).hexdigest()
+    cache_file = cache_dir / f"{digest}.pkl"
+    parsed = _read_cache_file(cache_file)
+    if parsed is None:
+        parsed = hcl2.loads(raw.decode())
+        _write_cache_file(cache_dir, cache_file, parsed)
+    return parsed
@@ -0,0 +1,103 @@
+"""
+Lambda function inventory shared by the infrastructure property tests.
+
+The expected functions, their IAM role groups and the critical functions with
+reserved concurrency, frozen so tests can share them without copying.
+"""
+from types import MappingProxyType
+
+
+# Expected Lambda functions based on backend/src/handlers/
+EXPECTED_FUNCTIONS = frozenset({
+    "strategies",
+    "templates",
+    "versions",
+    "deployments",
+    "streams",
+    "data-sources",
+    "backfills",
+    "quality",
+    "news-context",
+    "analysis",
+    "model-configs",
+    "providers",
+    "allocations",
+    "ensemble",
+    "performance",
+    "position-limits",
+    "drawdown",
+    "circuit-breakers",
+    "kill-switch",
+    "risk-profiles",
+    "risk-events",
+    "exchange-config",
+    "exchange-connections",
+    "exchange-orders",
+    "exchange-positions",
+    "audit",
+    "audit-packages",
+    "audit-stream",
+    "ai-traces",
+    "data-lineage",
+    "compliance-reports",
+    "trade-lifecycle",
+    "retention",
+    "snapshots",
+})
+
+# Function groups mapping
+FUNCTION_GROUPS = MappingProxyType({
+    "strategies": "strategy-management",
+    "templates": "strategy-management",
+    "versions": "strategy-management",
+    "deployments": "strategy-management",
+    "streams": "market-data",
+    "data-sources": "market-data",
+    "backfills": "market-data",
+    "quality": "market-data",
+    "news-context": "market-data",
+    "analysis": "ai-intelligence",
+    "model-configs": "ai-intelligence",
+    "providers": "ai-intelligence",
+    "allocations": "ai-intelligence",
+    "ensemble": "ai-intelligence",
+    "performance": "ai-intelligence",
+    "position-limits": "risk-controls",
+    "drawdown": "risk-controls",
+    "circuit-breakers": "risk-controls",
+    "kill-switch": "risk-controls",
+    "risk-profiles": "risk-controls",
+    "risk-events": "risk-controls",
+    "exchange-config": "exchange-integration",
+    "exchange-connections": "exchange-integration",
+    "exchange-orders": "exchange-integration",
+    "exchange-positions": "exchange-integration",
+    "audit": "audit",
+    "audit-packages": "audit",
+    "audit-stream": "audit",
+    "ai-traces": "audit",
+    "data-lineage": "audit",
+    "compliance-reports": "audit",
+    "trade-lifecycle": "audit",
+    "retention": "audit",
+    "snapshots": "audit",
+})
+
+# Valid function group names
+VALID_FUNCTION_GROUPS = frozenset({
+    "strategy-management",
+    "market-data",
+    "ai-intelligence",
+    "risk-controls",
+    "exchange-integration",
+    "audit",
+})
+
+# Critical functions with reserved concurrency
+CRITICAL_FUNCTIONS = MappingProxyType({
+    "kill-switch": 50,
+    "circuit-breakers": 20,
+    "exchange-orders": 100,
+    "position-limits": 10,
+    "drawdown": 10,
+})
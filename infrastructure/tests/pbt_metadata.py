@@ -0,0 +1,29 @@
+"""
+Traceability metadata for infrastructure property tests.
+
+Test classes and functions are tagged with the feature, property and
+requirements they validate via the ``property_test`` decorator instead of
+repeating the same boilerplate in every docstring. The metadata is reported
+as JUnit ``<property>`` entries by ``conftest.py``.
+"""
+
+
+def property_test(**meta):
+    """
+    Attach property-test metadata to a test class or function.
+
+    Common keys are ``feature``, ``property_id`` and ``validates``. Metadata on
+    a test function overrides the metadata of its enclosing class.
+    """
+    def deco(obj):
+        obj.__pbt_meta__ = meta
+        obj.__doc__ = obj.__doc__ or meta.get("summary")
+        return obj
+    return deco
+
+
+def get_property_meta(cls, fn) -> dict:
+    """Merge class-level and function-level metadata for a collected test."""
+    meta = dict(getattr(cls, "__pbt_meta__", {}))
+    meta.update(getattr(fn, "__pbt_meta__", {}))
+    return meta
@@ -12,25 +12,20 @@ domain names, and alarm thresholds.
 import pytest
 from hypothesis import given, strategies as st, settings
 
+from pbt_metadata import property_test
 
+
+@property_test(feature="infrastructure-deployment", property_id=13, validates=["20.1"])
 class TestInstanceSizeDifferentiation:
     """
     Property 13: Environment Configuration Differentiation (Instance Sizes)
     
     *For any* configurable parameter that differs between environments,
     the test environment SHALL use smaller instance sizes than production.
-    
-    **Validates: Requirements 20.1**
     """
     
     def test_lambda_memory_test_smaller_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.1
-        
-        Test environment Lambda memory should be smaller or equal to production.
-        """
+        """Test environment Lambda memory should be smaller or equal to production."""
         test_memory = test_tfvars.get('lambda_memory_default')
         prod_memory = production_tfvars.get('lambda_memory_default')
         
@@ -41,13 +36,7 @@ class TestInstanceSizeDifferentiation:
         )
     
     def test_redis_node_type_test_smaller_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.1
-        
-        Test environment Redis node type should be smaller than production.
-        """
+        """Test environment Redis node type should be smaller than production."""
         test_node_type = test_tfvars.get('redis_node_type')
         prod_node_type = production_tfvars.get('redis_node_type')
         
@@ -67,13 +56,7 @@ class TestInstanceSizeDifferentiation:
         )
     
     def test_redis_cache_nodes_test_fewer_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.1
-        
-        Test environment should have fewer Redis cache nodes than production.
-        """
+        """Test environment should have fewer Redis cache nodes than production."""
         test_nodes = test_tfvars.get('redis_num_cache_nodes')
         prod_nodes = production_tfvars.get('redis_num_cache_nodes')
         
@@ -84,24 +67,17 @@ class TestInstanceSizeDifferentiation:
         )
 
 
+@property_test(feature="infrastructure-deployment", property_id=13, validates=["20.2"])
 class TestRetentionPeriodDifferentiation:
     """
     Property 13: Environment Configuration Differentiation (Retention Periods)
     
     *For any* retention period configuration, the test environment SHALL use
     shorter retention periods than production.
-    
-    **Validates: Requirements 20.2**
     """
     
     def test_audit_log_retention_test_shorter_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.2
-        
-        Test environment audit log retention should be shorter than production.
-        """
+        """Test environment audit log retention should be shorter than production."""
         test_retention = test_tfvars.get('audit_log_retention_days')
         prod_retention = production_tfvars.get('audit_log_retention_days')
         
@@ -112,13 +88,7 @@ class TestRetentionPeriodDifferentiation:
         )
     
     def test_cloudwatch_log_retention_test_shorter_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.2
-        
-        Test environment CloudWatch log retention should be shorter than production.
-        """
+        """Test environment CloudWatch log retention should be shorter than production."""
         test_retention = test_tfvars.get('log_retention_days')
         prod_retention = production_tfvars.get('log_retention_days')
         
@@ -129,13 +99,7 @@ class TestRetentionPeriodDifferentiation:
         )
     
     def test_timestream_memory_retention_test_shorter_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.2
-        
-        Test environment Timestream memory retention should be shorter than production.
-        """
+        """Test environment Timestream memory retention should be shorter than production."""
         test_retention = test_tfvars.get('timestream_memory_retention_hours')
         prod_retention = production_tfvars.get('timestream_memory_retention_hours')
         
@@ -146,13 +110,7 @@ class TestRetentionPeriodDifferentiation:
         )
     
     def test_timestream_magnetic_retention_test_shorter_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.2
-        
-        Test environment Timestream magnetic retention should be shorter than production.
-        """
+        """Test environment Timestream magnetic retention should be shorter than production."""
         test_retention = test_tfvars.get('timestream_magnetic_retention_days')
         prod_retention = production_tfvars.get('timestream_magnetic_retention_days')
         
@@ -163,13 +121,7 @@ class TestRetentionPeriodDifferentiation:
         )
     
     def test_redis_snapshot_retention_test_shorter_or_equal_to_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.2
-        
-        Test environment Redis snapshot retention should be shorter or equal to production.
-        """
+        """Test environment Redis snapshot retention should be shorter or equal to production."""
         test_retention = test_tfvars.get('redis_snapshot_retention_days', 0)
         prod_retention = production_tfvars.get('redis_snapshot_retention_days', 0)
         
@@ -178,24 +130,17 @@ class TestRetentionPeriodDifferentiation:
         )
 
 
+@property_test(feature="infrastructure-deployment", property_id=13, validates=["20.3"])
 class TestScalingParameterDifferentiation:
     """
     Property 13: Environment Configuration Differentiation (Scaling Parameters)
     
     *For any* scaling parameter, the test environment SHALL use lower values
     than production.
-    
-    **Validates: Requirements 20.3**
     """
     
     def test_api_throttling_rate_test_lower_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.3
-        
-        Test environment API throttling rate should be lower than production.
-        """
+        """Test environment API throttling rate should be lower than production."""
         test_rate = test_tfvars.get('api_throttling_rate_limit')
         prod_rate = production_tfvars.get('api_throttling_rate_limit')
         
@@ -206,13 +151,7 @@ class TestScalingParameterDifferentiation:
         )
     
     def test_api_throttling_burst_test_lower_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.3
-        
-        Test environment API throttling burst should be lower than production.
-        """
+        """Test environment API throttling burst should be lower than production."""
         test_burst = test_tfvars.get('api_throttling_burst_limit')
         prod_burst = production_tfvars.get('api_throttling_burst_limit')
         
@@ -223,13 +162,7 @@ class TestScalingParameterDifferentiation:
         )
     
     def test_autoscaling_disabled_in_test_enabled_in_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.3
-        
-        Test environment should have autoscaling disabled, production should have it enabled.
-        """
+        """Test environment should have autoscaling disabled, production should have it enabled."""
         test_autoscaling = test_tfvars.get('enable_autoscaling')
         prod_autoscaling = production_tfvars.get('enable_autoscaling')
         
@@ -239,13 +172,7 @@ class TestScalingParameterDifferentiation:
         assert prod_autoscaling == True, "Production environment should have autoscaling enabled"
     
     def test_provisioned_concurrency_disabled_in_test_enabled_in_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.3
-        
-        Test environment should have provisioned concurrency disabled, production enabled.
-        """
+        """Test environment should have provisioned concurrency disabled, production enabled."""
         test_provisioned = test_tfvars.get('enable_provisioned_concurrency')
         prod_provisioned = production_tfvars.get('enable_provisioned_concurrency')
         
@@ -255,13 +182,7 @@ class TestScalingParameterDifferentiation:
         assert prod_provisioned == True, "Production environment should have provisioned concurrency enabled"
     
     def test_single_nat_gateway_in_test_multi_in_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.3
-        
-        Test environment should use single NAT gateway, production should use multiple.
-        """
+        """Test environment should use single NAT gateway, production should use multiple."""
         test_single_nat = test_tfvars.get('single_nat_gateway')
         prod_single_nat = production_tfvars.get('single_nat_gateway')
         
@@ -271,13 +192,7 @@ class TestScalingParameterDifferentiation:
         assert prod_single_nat == False, "Production environment should use multiple NAT gateways"
     
     def test_redis_multi_az_disabled_in_test_enabled_in_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.3
-        
-        Test environment should have Redis multi-AZ disabled, production enabled.
-        """
+        """Test environment should have Redis multi-AZ disabled, production enabled."""
         test_multi_az = test_tfvars.get('redis_multi_az')
         prod_multi_az = production_tfvars.get('redis_multi_az')
         
@@ -287,13 +202,7 @@ class TestScalingParameterDifferentiation:
         assert prod_multi_az == True, "Production environment should have Redis multi-AZ enabled"
     
     def test_availability_zones_fewer_in_test_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.3
-        
-        Test environment should use fewer availability zones than production.
-        """
+        """Test environment should use fewer availability zones than production."""
         test_azs = test_tfvars.get('availability_zones', [])
         prod_azs = production_tfvars.get('availability_zones', [])
         
@@ -304,24 +213,17 @@ class TestScalingParameterDifferentiation:
         )
 
 
+@property_test(feature="infrastructure-deployment", property_id=13, validates=["20.4"])
 class TestDomainNameDifferentiation:
     """
     Property 13: Environment Configuration Differentiation (Domain Names)
     
     *For any* domain name configuration, the test and production environments
     SHALL have different domain names.
-    
-    **Validates: Requirements 20.4**
     """
     
     def test_domain_names_differ_between_environments(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.4
-        
-        Test and production environments must have different domain names.
-        """
+        """Test and production environments must have different domain names."""
         test_domain = test_tfvars.get('domain_name')
         prod_domain = production_tfvars.get('domain_name')
         
@@ -333,13 +235,7 @@ class TestDomainNameDifferentiation:
         )
     
     def test_api_domain_names_differ_between_environments(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.4
-        
-        Test and production environments must have different API domain names.
-        """
+        """Test and production environments must have different API domain names."""
         test_api_domain = test_tfvars.get('api_domain_name')
         prod_api_domain = production_tfvars.get('api_domain_name')
         
@@ -351,13 +247,7 @@ class TestDomainNameDifferentiation:
         )
     
     def test_test_domain_contains_test_identifier(self, test_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.4
-        
-        Test environment domain should contain 'test' identifier for clarity.
-        """
+        """Test environment domain should contain 'test' identifier for clarity."""
         test_domain = test_tfvars.get('domain_name')
         
         assert test_domain is not None, "Test environment must define domain_name"
@@ -366,13 +256,7 @@ class TestDomainNameDifferentiation:
         )
     
     def test_production_domain_does_not_contain_test_identifier(self, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.4
-        
-        Production environment domain should not contain 'test' identifier.
-        """
+        """Production environment domain should not contain 'test' identifier."""
         prod_domain = production_tfvars.get('domain_name')
         
         assert prod_domain is not None, "Production environment must define domain_name"
@@ -381,24 +265,17 @@ class TestDomainNameDifferentiation:
         )
 
 
+@property_test(feature="infrastructure-deployment", property_id=13, validates=["20.5"])
 class TestBudgetDifferentiation:
     """
     Property 13: Environment Configuration Differentiation (Budget/Cost)
     
     *For any* budget configuration, the test environment SHALL have lower
     budget thresholds than production.
-    
-    **Validates: Requirements 20.5**
     """
     
     def test_monthly_budget_test_lower_than_production(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.5
-        
-        Test environment monthly budget should be lower than production.
-        """
+        """Test environment monthly budget should be lower than production."""
         test_budget = test_tfvars.get('monthly_budget_amount')
         prod_budget = production_tfvars.get('monthly_budget_amount')
         
@@ -409,23 +286,16 @@ class TestBudgetDifferentiation:
         )
 
 
+@property_test(feature="infrastructure-deployment", property_id=13, validates=["20.1", "20.2", "20.3", "20.4", "20.5"])
 class TestEnvironmentIdentifierDifferentiation:
     """
     Property 13: Environment Configuration Differentiation (Environment Identifier)
     
     *For any* environment, the environment identifier SHALL be correctly set.
-    
-    **Validates: Requirements 20.1, 20.2, 20.3, 20.4, 20.5**
     """
     
     def test_environment_identifiers_are_different(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.1, 20.2, 20.3, 20.4, 20.5
-        
-        Test and production environments must have different environment identifiers.
-        """
+        """Test and production environments must have different environment identifiers."""
         test_env = test_tfvars.get('environment')
         prod_env = production_tfvars.get('environment')
         
@@ -436,48 +306,29 @@ class TestEnvironmentIdentifierDifferentiation:
         )
     
     def test_test_environment_identifier_is_test(self, test_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.1, 20.2, 20.3, 20.4, 20.5
-        
-        Test environment identifier should be 'test'.
-        """
+        """Test environment identifier should be 'test'."""
         test_env = test_tfvars.get('environment')
         
         assert test_env == 'test', f"Test environment identifier should be 'test', got '{test_env}'"
     
     def test_production_environment_identifier_is_production(self, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.1, 20.2, 20.3, 20.4, 20.5
-        
-        Production environment identifier should be 'production'.
-        """
+        """Production environment identifier should be 'production'."""
         prod_env = production_tfvars.get('environment')
         
         assert prod_env == 'production', f"Production environment identifier should be 'production', got '{prod_env}'"
 
 
+@property_test(feature="infrastructure-deployment", property_id=13, validates=["20.1", "20.3"])
 class TestDynamoDBBillingModeDifferentiation:
     """
     Property 13: Environment Configuration Differentiation (DynamoDB Billing)
     
     *For any* DynamoDB billing configuration, test should use on-demand
     and production should use provisioned capacity.
-    
-    **Validates: Requirements 20.1, 20.3**
     """
     
     def test_dynamodb_billing_mode_differs(self, test_tfvars, production_tfvars):
-        """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.1, 20.3
-        
-        Test should use PAY_PER_REQUEST, production should use PROVISIONED.
-        """
+        """Test should use PAY_PER_REQUEST, production should use PROVISIONED."""
         test_billing = test_tfvars.get('dynamodb_billing_mode')
         prod_billing = production_tfvars.get('dynamodb_billing_mode')
         
@@ -491,13 +342,10 @@ class TestDynamoDBBillingModeDifferentiation:
         )
 
 
+@property_test(feature="infrastructure-deployment", property_id=13, validates=["20.1", "20.2", "20.3", "20.4", "20.5"])
 class TestEnvironmentDifferentiationPropertyBased:
     """
     Property-based tests using Hypothesis to validate environment differentiation.
-    
-    Feature: infrastructure-deployment
-    Property 13: Environment Configuration Differentiation
-    Validates: Requirements 20.1, 20.2, 20.3, 20.4, 20.5
     """
     
     @given(
@@ -507,10 +355,6 @@ class TestEnvironmentDifferentiationPropertyBased:
     @settings(max_examples=100)
     def test_production_values_should_be_larger_than_test(self, test_value, prod_multiplier):
         """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.1, 20.2, 20.3, 20.4, 20.5
-        
         *For any* numeric configuration value, if production uses a multiplier > 1,
         the production value SHALL be greater than the test value.
         """
@@ -520,6 +364,7 @@ class TestEnvironmentDifferentiationPropertyBased:
             f"Production value ({prod_value}) should be > test value ({test_value})"
         )
     
+    @property_test(validates=["20.2"])
     @given(
         retention_days=st.integers(min_value=1, max_value=365),
         prod_multiplier=st.integers(min_value=2, max_value=30)
@@ -527,10 +372,6 @@ class TestEnvironmentDifferentiationPropertyBased:
     @settings(max_examples=100)
     def test_retention_period_scaling_property(self, retention_days, prod_multiplier):
         """
-        Feature: infrastructure-deployment
-        Property 13: Environment Configuration Differentiation
-        Validates: Requirements 20.2
-        
         *For any* retention period, production retention SHALL be at least
         as long as test retention when using a multiplier >= 1.
         """